@@ -6,6 +6,7 @@ class ErrorCode(Enum):
     ROW_ALREADY_EXIST = 40000
     USER_ALREADY_SIGNED_UP = 40001
     DUPLICATED_NICKNAME = 40002
+    INVALID_UPLOAD_FILE = 40003
 
     # 401 Unauthorized Error
     NOT_ACCESSIBLE = 40100
@@ -0,0 +1,107 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from claon_admin.config.consts import SUBJECT_CACHE_MAX_SIZE
+from claon_admin.model.auth import RequestUser
+
+
+class TTLCache:
+    """ Bounded LRU cache whose entries may additionally expire after a per-entry ttl (seconds) """
+
+    def __init__(self,
+                 max_size: int,
+                 ttl: Optional[float] = None,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: OrderedDict[Hashable, Tuple[Any, Optional[float]]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        value, expire_at = item
+        if expire_at is not None and expire_at <= time.monotonic():
+            self._evict(key)
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (value, None if ttl is None else time.monotonic() + ttl)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._evict(next(iter(self._data)))
+
+    def delete(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def _evict(self, key: Hashable):
+        value, _ = self._data.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SubjectCache:
+    """ Resolved request users keyed by access token digest, valid until token expiry or user change """
+
+    def __init__(self, max_size: int):
+        self._cache = TTLCache(max_size, on_evict=self._on_evict)
+        self._keys_by_user: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, access_token: str, refresh_token: str) -> Optional[RequestUser]:
+        entry = self._cache.get(self._digest(access_token))
+        if entry is None:
+            return None
+
+        refresh_digest, subject = entry
+        if refresh_digest != self._digest(refresh_token):
+            return None
+        return subject
+
+    def set(self, access_token: str, refresh_token: str, subject: RequestUser, expire_at: float):
+        ttl = expire_at - time.time()
+        if ttl <= 0:
+            return
+
+        key = self._digest(access_token)
+        self._cache.set(key, (self._digest(refresh_token), subject), ttl)
+        self._keys_by_user.setdefault(subject.id, set()).add(key)
+
+    def invalidate(self, user_id: str):
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._cache.delete(key)
+
+    def clear(self):
+        self._cache.clear()
+        self._keys_by_user.clear()
+
+    def _on_evict(self, key: str, entry: Tuple[str, RequestUser]):
+        keys = self._keys_by_user.get(entry[1].id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry[1].id]
+
+
+subject_cache = SubjectCache(max_size=SUBJECT_CACHE_MAX_SIZE)
@@ -0,0 +1,50 @@
+import os
+import threading
+import time
+import uuid
+from typing import Iterable, List
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_last_counter = 0
+
+COUNTER_MAX = 0xFFF
+RAND_B_MASK = (1 << 62) - 1
+
+
+def generate_ids(count: int) -> List[str]:
+    """
+    Generate time-ordered UUIDv7 strings (RFC 9562).
+    The 12-bit rand_a field is a counter, so ids generated by one process sort in creation order.
+    """
+    global _last_timestamp, _last_counter
+
+    ids = []
+    randoms = os.urandom(8 * count)
+    with _lock:
+        now = time.time_ns() // 1_000_000
+        for i in range(count):
+            if now > _last_timestamp:
+                _last_timestamp = now
+                _last_counter = int.from_bytes(randoms[8 * i:8 * i + 2], "big") & (COUNTER_MAX >> 1)
+            elif _last_counter < COUNTER_MAX:
+                _last_counter += 1
+            else:
+                _last_timestamp += 1
+                _last_counter = 0
+
+            rand_b = int.from_bytes(randoms[8 * i:8 * i + 8], "big") & RAND_B_MASK
+            value = _last_timestamp << 80 | 0x7 << 76 | _last_counter << 64 | 0b10 << 62 | rand_b
+            ids.append(str(uuid.UUID(int=value)))
+    return ids
+
+
+def generate_id() -> str:
+    return generate_ids(1)[0]
+
+
+def assign_ids(entities: Iterable) -> None:
+    """ Assign ids to entities without one, so the ORM can batch their inserts into one executemany """
+    missing = [e for e in entities if e.id is None]
+    for entity, entity_id in zip(missing, generate_ids(len(missing))):
+        entity.id = entity_id
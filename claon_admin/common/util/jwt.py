@@ -18,19 +18,19 @@ def create_access_token(user_id: str) -> str:
     return jwt.encode(to_encode, JWT_SECRET_KEY, JWT_ALGORITHM)
 
 
-def create_refresh_token(user_id: str) -> str:
+async def create_refresh_token(user_id: str) -> str:
     to_encode = {
         "exp": datetime.now(TIME_ZONE_KST) + timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES)
     }
 
     token = jwt.encode(to_encode, JWT_REFRESH_SECRET_KEY, JWT_ALGORITHM)
-    save_refresh_token(token, user_id)
+    await save_refresh_token(token, user_id)
     return token
 
 
-def reissue_refresh_token(refresh_token: str, user_id: str) -> str:
-    delete_refresh_token(refresh_token)
-    return create_refresh_token(user_id)
+async def reissue_refresh_token(refresh_token: str, user_id: str) -> str:
+    await delete_refresh_token(refresh_token)
+    return await create_refresh_token(user_id)
 
 
 def resolve_access_token(access_token: str) -> dict:
@@ -0,0 +1,43 @@
+import json
+import logging
+import logging.handlers
+import queue
+
+RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({})).keys()) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """ Formats a record as one JSON object, including every field passed through `extra` """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        data.update((key, value) for key, value in vars(record).items() if key not in RESERVED_ATTRS)
+
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """ Queue handler for a bounded queue which either blocks or drops records when the queue is full """
+
+    def __init__(self, log_queue: queue.Queue, block: bool = False):
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
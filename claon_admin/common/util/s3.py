@@ -1,11 +1,15 @@
+import asyncio
 import mimetypes
 import os
 import uuid
 from datetime import datetime
-from tempfile import NamedTemporaryFile
+from functools import lru_cache
+from typing import List, Optional
 
 import boto3
+from botocore.exceptions import ClientError
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
 
 from claon_admin.common.error.exception import InternalServerException, ErrorCode
 from claon_admin.config.consts import AWS_ACCESS_KEY_ID
@@ -13,29 +17,133 @@ from claon_admin.config.consts import AWS_SECRET_ACCESS_KEY
 from claon_admin.config.consts import BUCKET
 from claon_admin.config.consts import REGION_NAME
 
-client_s3 = boto3.client(
-    's3',
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=REGION_NAME
-)
+# S3 rejects multipart parts smaller than 5 MiB except for the last one
+PART_SIZE = 8 * 1024 * 1024
+MAX_CONCURRENT_PARTS = 4
+
+
+@lru_cache(maxsize=None)
+def get_s3_client():
+    return boto3.client(
+        's3',
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=REGION_NAME
+    )
+
+
+def make_key_name(domain: str, purpose: str, filename: str) -> str:
+    file_extension = filename.split('.')[-1]
+    return os.path.join(domain, purpose, str(datetime.now().date()), str(uuid.uuid4()) + '.' + file_extension)
+
+
+def object_url(key_name: str) -> str:
+    return os.path.join("https://" + BUCKET + ".s3." + REGION_NAME + ".amazonaws.com", key_name)
 
 
 async def upload_file(file: UploadFile, domain: str, purpose: str):
-    file_extension = file.filename.split('.')[-1]
-    key_name = os.path.join(domain, purpose, str(datetime.now().date()), str(uuid.uuid4()) + '.' + file_extension)
+    key_name = make_key_name(domain, purpose, file.filename)
 
     try:
-        with NamedTemporaryFile() as temp_file:
-            temp_file.write(await file.read())
-            temp_file.seek(0)
-            client_s3.upload_fileobj(
-                temp_file,
-                BUCKET,
-                key_name,
-                ExtraArgs={"ContentType": mimetypes.guess_type(f"{file.filename}")[0], "ACL": "public-read"}
-            )
-
-            return os.path.join("https://" + BUCKET + ".s3." + REGION_NAME + ".amazonaws.com", key_name)
+        await upload_stream(file, key_name, mimetypes.guess_type(f"{file.filename}")[0])
+        return object_url(key_name)
     except Exception:
         raise InternalServerException(ErrorCode.INTERNAL_SERVER_ERROR, "S3 객체 업로드를 실패했습니다.")
+
+
+async def upload_stream(file: UploadFile, key_name: str, content_type: Optional[str], client=None):
+    """
+    Upload the file in PART_SIZE chunks as S3 multipart parts.
+    At most MAX_CONCURRENT_PARTS parts are held in memory, and boto3 calls run in the thread pool.
+    """
+    client = client or get_s3_client()
+    extra_args = {"ContentType": content_type or "application/octet-stream", "ACL": "public-read"}
+
+    chunk = await file.read(PART_SIZE)
+    if len(chunk) < PART_SIZE:
+        await run_in_threadpool(client.put_object, Bucket=BUCKET, Key=key_name, Body=chunk, **extra_args)
+        return
+
+    multipart_upload = await run_in_threadpool(
+        client.create_multipart_upload, Bucket=BUCKET, Key=key_name, **extra_args
+    )
+    upload_id = multipart_upload["UploadId"]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PARTS)
+    tasks: List[asyncio.Task] = []
+
+    async def upload_part(part_number: int, body: bytes):
+        try:
+            response = await run_in_threadpool(
+                client.upload_part,
+                Bucket=BUCKET,
+                Key=key_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+        finally:
+            semaphore.release()
+
+    try:
+        part_number = 1
+        while chunk:
+            await semaphore.acquire()
+            failed = next((task for task in tasks if task.done() and task.exception() is not None), None)
+            if failed is not None:
+                semaphore.release()
+                raise failed.exception()
+
+            tasks.append(asyncio.create_task(upload_part(part_number, chunk)))
+            part_number += 1
+            chunk = await file.read(PART_SIZE)
+
+        parts = await asyncio.gather(*tasks)
+        await run_in_threadpool(
+            client.complete_multipart_upload,
+            Bucket=BUCKET,
+            Key=key_name,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts}
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await run_in_threadpool(client.abort_multipart_upload, Bucket=BUCKET, Key=key_name, UploadId=upload_id)
+        raise
+
+
+def create_presigned_post(key_name: str, content_type: str, max_size: int, expires_in: int) -> dict:
+    """ Sign a browser POST policy which only accepts the given content type and at most max_size bytes """
+    return get_s3_client().generate_presigned_post(
+        Bucket=BUCKET,
+        Key=key_name,
+        Fields={"Content-Type": content_type, "acl": "public-read"},
+        Conditions=[
+            {"Content-Type": content_type},
+            {"acl": "public-read"},
+            ["content-length-range", 1, max_size]
+        ],
+        ExpiresIn=expires_in
+    )
+
+
+async def head_object(key_name: str) -> Optional[dict]:
+    try:
+        return await run_in_threadpool(get_s3_client().head_object, Bucket=BUCKET, Key=key_name)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return None
+        raise
+
+
+async def read_object_prefix(key_name: str, size: int) -> bytes:
+    response = await run_in_threadpool(
+        get_s3_client().get_object, Bucket=BUCKET, Key=key_name, Range="bytes=0-%d" % (size - 1)
+    )
+    return await run_in_threadpool(response["Body"].read)
+
+
+async def delete_object(key_name: str):
+    await run_in_threadpool(get_s3_client().delete_object, Bucket=BUCKET, Key=key_name)
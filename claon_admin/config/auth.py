@@ -2,14 +2,27 @@ from dependency_injector.wiring import Provide
 from fastapi import Header, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from claon_admin.common.error.exception import UnauthorizedException, ErrorCode, InternalServerException
+from claon_admin.common.error.exception import UnauthorizedException, ErrorCode, InternalServerException, \
+    BaseRuntimeException
+from claon_admin.common.util.cache import subject_cache
 from claon_admin.common.util.header import add_jwt_tokens
 from claon_admin.common.util.jwt import resolve_access_token, resolve_refresh_token, is_expired, create_access_token, \
     reissue_refresh_token
 from claon_admin.common.util.redis import find_user_id_by_refresh_token
 from claon_admin.container import db, Container
 from claon_admin.model.auth import RequestUser
-from claon_admin.schema.user import UserRepository
+from claon_admin.schema.user import UserRepository, User
+
+
+def to_request_user(user: User) -> RequestUser:
+    return RequestUser(
+        id=user.id,
+        profile_image=user.profile_img,
+        nickname=user.nickname,
+        email=user.email,
+        instagram_nickname=user.instagram_name,
+        role=user.role
+    )
 
 
 async def get_subject(
@@ -32,6 +45,10 @@ async def get_subject(
                 "Cannot find refresh token from request header."
             )
 
+        subject = subject_cache.get(access_token, refresh_token)
+        if subject is not None:
+            return subject
+
         access_payload = resolve_access_token(access_token)
         refresh_payload = resolve_refresh_token(refresh_token)
 
@@ -42,14 +59,14 @@ async def get_subject(
                     "Both access token and refresh token are expired."
                 )
 
-            user_id = find_user_id_by_refresh_token(refresh_token)
+            user_id = await find_user_id_by_refresh_token(refresh_token)
             if user_id is None:
                 raise UnauthorizedException(
                     ErrorCode.INVALID_JWT,
                     "Refresh token is not valid."
                 )
 
-            add_jwt_tokens(response, create_access_token(user_id), reissue_refresh_token(refresh_token, user_id))
+            add_jwt_tokens(response, create_access_token(user_id), await reissue_refresh_token(refresh_token, user_id))
 
             user = await user_repository.find_by_id(session, user_id)
             if user is None:
@@ -58,14 +75,7 @@ async def get_subject(
                     "Not existing user account."
                 )
 
-            return RequestUser(
-                id=user.id,
-                profile_image=user.profile_image,
-                nickname=user.nickname,
-                email=user.email,
-                instagram_nickname=user.instagram_nickname,
-                role=user.role
-            )
+            return to_request_user(user)
         else:
             if is_expired(refresh_payload):
                 raise UnauthorizedException(
@@ -80,14 +90,16 @@ async def get_subject(
                     "Not existing user account."
                 )
 
-            return RequestUser(
-                id=user.id,
-                profile_image=user.profile_image,
-                nickname=user.nickname,
-                email=user.email,
-                instagram_nickname=user.instagram_nickname,
-                role=user.role
+            subject = to_request_user(user)
+            subject_cache.set(
+                access_token,
+                refresh_token,
+                subject,
+                min(access_payload.get("exp"), refresh_payload.get("exp"))
             )
+            return subject
+    except BaseRuntimeException:
+        raise
     except Exception:
         raise InternalServerException(
             ErrorCode.INTERNAL_SERVER_ERROR,
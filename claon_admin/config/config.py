@@ -30,6 +30,11 @@ except FileNotFoundError:
 class Config:
     TRUSTED_HOSTS = ["*"]
     ALLOW_SITE = ["*"]
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    DB_STATEMENT_CACHE_SIZE: int = 100
 
 
 @dataclass
@@ -52,7 +57,12 @@ class LocalConfig(Config):
 class ProdConfig(Config):
     DEBUG: bool = False
     TEST_MODE: bool = False
-    DB_ECHO: bool = True
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = db_config.getint("POOL", "SIZE", fallback=20)
+    DB_MAX_OVERFLOW: int = db_config.getint("POOL", "MAX_OVERFLOW", fallback=10)
+    DB_POOL_RECYCLE: int = db_config.getint("POOL", "RECYCLE", fallback=1800)
+    DB_POOL_TIMEOUT: int = db_config.getint("POOL", "TIMEOUT", fallback=10)
+    DB_STATEMENT_CACHE_SIZE: int = db_config.getint("POOL", "STATEMENT_CACHE_SIZE", fallback=500)
     IP = db_config.get("DB", "IP", fallback="localhost")
     PORT = db_config.get("DB", "PORT", fallback="5432")
     DB_NAME = db_config.get("DB", "DB_NAME", fallback="claon_db")
@@ -22,5 +22,8 @@ JWT_REFRESH_SECRET_KEY = config.get("JWT", "JWT_REFRESH_SECRET_KEY")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(config.get("JWT", "ACCESS_TOKEN_EXPIRE_MINUTES"))
 REFRESH_TOKEN_EXPIRE_MINUTES = int(config.get("JWT", "REFRESH_TOKEN_EXPIRE_MINUTES"))
 
+# CACHE
+SUBJECT_CACHE_MAX_SIZE = 10000
+
 # GOOGLE OAUTH
 GOOGLE_CLIENT_ID = config.get("GOOGLE", "CLIENT_ID")
@@ -1,5 +1,39 @@
+import atexit
 import logging
+import logging.config
+import queue
+from logging.handlers import QueueListener
 
-logging.config.fileConfig('logging.conf', disable_existing_loggers=False)
+from claon_admin.common.util.log import BoundedQueueHandler
+
+LOG_QUEUE_SIZE = 10000
+LOG_QUEUE_BLOCK = False
+
+
+def init_logging() -> QueueListener:
+    """ Move handlers configured by logging.conf behind a bounded queue drained by a background thread """
+    logging.config.fileConfig('logging.conf', disable_existing_loggers=False)
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root.addHandler(BoundedQueueHandler(log_queue, block=LOG_QUEUE_BLOCK))
+
+    queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_listener.start()
+    return queue_listener
+
+
+def stop_logging() -> None:
+    """ Flush queued records and stop the listener thread, safe to call more than once """
+    if listener._thread is not None:
+        listener.stop()
+
+
+listener = init_logging()
+atexit.register(stop_logging)
 
 logger = logging.getLogger(__name__)
@@ -1,10 +1,27 @@
-import redis
+from typing import Optional
+
+from redis import asyncio as aioredis
 
 
 class Redis:
     def __init__(self, host, port):
         self.host = host
         self.port = port
+        self._pool: Optional[aioredis.ConnectionPool] = None
+        self._client: Optional[aioredis.Redis] = None
+
+    def connect(self):
+        if self._client is None:
+            self._pool = aioredis.ConnectionPool(host=self.host, port=self.port, db=0, decode_responses=True)
+            self._client = aioredis.Redis(connection_pool=self._pool)
+
+    async def disconnect(self):
+        if self._pool is not None:
+            await self._pool.disconnect()
+        self._pool = None
+        self._client = None
 
-    def get_connection(self):
-        return redis.StrictRedis(host=self.host, port=self.port, db=0)
+    def get_connection(self) -> aioredis.Redis:
+        if self._client is None:
+            self.connect()
+        return self._client
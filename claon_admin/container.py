@@ -8,9 +8,19 @@ from claon_admin.schema.center import CenterRepository, CenterApprovedFileReposi
     CenterWallRepository
 from claon_admin.schema.conn import Database
 from claon_admin.schema.user import UserRepository, LectorRepository, LectorApprovedFileRepository
+from claon_admin.service.center import CenterService
 from claon_admin.service.user import UserService
 
-db = Database(db_url=asdict(conf())['DB_URL'])
+config = asdict(conf())
+db = Database(
+    db_url=config['DB_URL'],
+    echo=config['DB_ECHO'],
+    pool_size=config['DB_POOL_SIZE'],
+    max_overflow=config['DB_MAX_OVERFLOW'],
+    pool_recycle=config['DB_POOL_RECYCLE'],
+    pool_timeout=config['DB_POOL_TIMEOUT'],
+    statement_cache_size=config['DB_STATEMENT_CACHE_SIZE']
+)
 
 
 class Container(containers.DeclarativeContainer):
@@ -44,3 +54,5 @@ class Container(containers.DeclarativeContainer):
         center_wall_repository=center_wall_repository,
         oauth_user_info_provider_supplier=oauth_user_info_provider_supplier
     )
+
+    center_service = providers.Factory(CenterService)
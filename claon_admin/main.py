@@ -9,10 +9,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from claon_admin.common.error.handler import add_http_exception_handler
+from claon_admin.common.util.redis import redis
 from claon_admin.config.consts import SESSION_SECRET_KEY
 from claon_admin.container import Container, db
 from claon_admin.middleware.log import LoggerMiddleware
-from claon_admin.router import center, auth, admin
+from claon_admin.router import center, auth, admin, health
 
 nest_asyncio.apply()
 
@@ -28,7 +29,7 @@ def create_app() -> FastAPI:
     container = Container()
 
     """ Define Container """
-    container.wire(modules=[auth])
+    container.wire(modules=[auth, center])
     app.container = container
 
     """ Define Routers """
@@ -38,6 +39,7 @@ def create_app() -> FastAPI:
     app.include_router(auth.router, prefix=api_prefix + "/auth")
     app.include_router(center.router, prefix=api_prefix + "/centers")
     app.include_router(admin.router, prefix=api_prefix + "/admin")
+    app.include_router(health.router, prefix=api_prefix + "/health")
 
     app.add_middleware(
         CORSMiddleware,
@@ -48,10 +50,16 @@ def create_app() -> FastAPI:
     )
 
     app.add_middleware(SessionMiddleware, secret_key=SESSION_SECRET_KEY)
-    app.add_middleware(LoggerMiddleware)
+    app.add_middleware(LoggerMiddleware, sample_rates={api_prefix + "/auth/nickname": 0.1})
 
     add_http_exception_handler(app)
 
+    """ Define Lifecycle """
+    app.add_event_handler("startup", db.connect)
+    app.add_event_handler("startup", redis.connect)
+    app.add_event_handler("shutdown", db.disconnect)
+    app.add_event_handler("shutdown", redis.disconnect)
+
     return app
 
 
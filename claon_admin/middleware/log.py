@@ -1,44 +1,102 @@
+import random
+import time
 import uuid
+from typing import Dict, Iterable, Optional
 
-from fastapi import Request
-from starlette.concurrency import iterate_in_threadpool
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
-from starlette.types import Message
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from claon_admin.config.log import logger
 
 
-async def set_body(request: Request):
-    receive_ = await request._receive()
+class BodyLog:
+    """ Counts bytes flowing through a stream and keeps a bounded prefix of them for logging """
 
-    async def receive() -> Message:
-        return receive_
+    def __init__(self, limit: int, enabled: bool = True):
+        self.limit = limit
+        self.enabled = enabled
+        self.size = 0
+        self.prefix = bytearray()
 
-    request._receive = receive
+    def feed(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.enabled and len(self.prefix) < self.limit:
+            self.prefix += chunk[:self.limit - len(self.prefix)]
 
+    def text(self) -> str:
+        text = self.prefix.decode('utf-8', errors='replace')
+        return text + "..." if self.size > len(self.prefix) else text
 
-class LoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
 
-        idem = ''.join(str(uuid.uuid4()))
-        request_headers = dict(request.headers)
-        logger.info(f"[{idem}] [REQUEST] [{request.method}] path: {request.url.path}")
-        if request_headers.get('content-type') is not None and not (
-                "multipart/form-data" in request_headers['content-type']):
-            await set_body(request)
-            request_body = await request.body()
-            if request_body and not ("multipart/form-data" in request_headers['content-type']):
-                logger.info(f"[{idem}] [REQUEST] body: {request_body.decode('utf-8')}")
+class LoggerMiddleware:
+    def __init__(self,
+                 app: ASGIApp,
+                 body_limit: int = 1024,
+                 sample_rates: Optional[Dict[str, float]] = None,
+                 exclude_paths: Iterable[str] = ("/docs", "/redoc", "/openapi.json")):
+        self.app = app
+        self.body_limit = body_limit
+        self.sample_rates = sorted((sample_rates or {}).items(), key=lambda e: len(e[0]), reverse=True)
+        self.exclude_paths = set(exclude_paths)
 
-        response = await call_next(request)
+    def is_sampled(self, path: str) -> bool:
+        if path in self.exclude_paths:
+            return False
 
-        response_body = [chunk async for chunk in response.body_iterator]
-        response.body_iterator = iterate_in_threadpool(iter(response_body))
+        for prefix, rate in self.sample_rates:
+            if path.startswith(prefix):
+                return random.random() < rate
+        return True
 
-        logger.info(f"[{idem}] [RESPONSE] status_code: {response.status_code}")
-        logger.info(f"[{idem}] [RESPONSE] body: {response_body[0].decode('utf-8')}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        idem = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = idem
+        if not self.is_sampled(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        extra = {"request_id": idem}
+        logger.info(f"[{idem}] [REQUEST] [{scope['method']}] path: {scope['path']}", extra=extra)
+
+        content_type = Headers(scope=scope).get('content-type')
+        request_body = BodyLog(self.body_limit, content_type is not None and "multipart/form-data" not in content_type)
+        response_body = BodyLog(self.body_limit)
+        status_code = None
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.feed(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_content_type = Headers(raw=message.get("headers", [])).get('content-type', "")
+                response_body.enabled = not response_content_type.startswith(("image/", "application/octet-stream"))
+            elif message["type"] == "http.response.body":
+                response_body.feed(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            latency_ms = round((time.perf_counter() - start) * 1000, 3)
+            if request_body.size:
+                logger.info(f"[{idem}] [REQUEST] body ({request_body.size} bytes): {request_body.text()}", extra=extra)
+            logger.info(f"[{idem}] [RESPONSE] status_code: {status_code}, latency: {latency_ms}ms", extra={
+                "request_id": idem,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "latency_ms": latency_ms,
+                "request_bytes": request_body.size,
+                "response_bytes": response_body.size
+            })
+            logger.info(f"[{idem}] [RESPONSE] body ({response_body.size} bytes): {response_body.text()}", extra=extra)
@@ -1,5 +1,5 @@
 import re
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from pydantic import BaseModel, validator
 
@@ -228,3 +228,26 @@ class CenterRequestDto(BaseModel):
 
 class UploadFileResponseDto(BaseModel):
     file_url: str
+
+
+class PresignedUploadRequestDto(BaseModel):
+    filename: str
+    content_type: str
+    size: int
+
+    @validator('size')
+    def validate_size(cls, value):
+        if value <= 0:
+            raise ValueError('파일 크기는 0보다 커야 해요.')
+        return value
+
+
+class PresignedUploadResponseDto(BaseModel):
+    url: str
+    fields: Dict[str, str]
+    key: str
+    expires_in: int
+
+
+class ConfirmUploadRequestDto(BaseModel):
+    key: str
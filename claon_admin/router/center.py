@@ -1,18 +1,24 @@
+from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, UploadFile, File
 from fastapi_utils.cbv import cbv
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from claon_admin.container import db
-from claon_admin.model.center import CenterNameResponseDto, CenterResponseDto, UploadFileResponseDto
+from claon_admin.common.util.s3 import upload_file
+from claon_admin.container import db, Container
+from claon_admin.model.center import CenterNameResponseDto, CenterResponseDto, UploadFileResponseDto, \
+    PresignedUploadRequestDto, PresignedUploadResponseDto, ConfirmUploadRequestDto
 from claon_admin.model.enum import CenterUploadPurpose
+from claon_admin.service.center import CenterService
 
 router = APIRouter()
 
 
 @cbv(router)
 class CenterRouter:
-    def __init__(self):
-        pass
+    @inject
+    def __init__(self,
+                 center_service: CenterService = Depends(Provide[Container.center_service])):
+        self.center_service = center_service
 
     @router.get('/name/{name}', response_model=CenterNameResponseDto)
     async def get_name(self,
@@ -30,4 +36,16 @@ class CenterRouter:
     async def upload(self,
                      purpose: CenterUploadPurpose,
                      file: UploadFile = File(...)):
-        pass
+        return UploadFileResponseDto(file_url=await upload_file(file, "center", purpose.value))
+
+    @router.post('/{purpose}/file/presigned', response_model=PresignedUploadResponseDto)
+    async def create_presigned_upload(self,
+                                      purpose: CenterUploadPurpose,
+                                      dto: PresignedUploadRequestDto):
+        return await self.center_service.create_presigned_upload(purpose, dto)
+
+    @router.post('/{purpose}/file/confirm', response_model=UploadFileResponseDto)
+    async def confirm_upload(self,
+                             purpose: CenterUploadPurpose,
+                             dto: ConfirmUploadRequestDto):
+        return await self.center_service.confirm_upload(purpose, dto)
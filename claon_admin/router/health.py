@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi_utils.cbv import cbv
+
+from claon_admin.container import db
+
+router = APIRouter()
+
+
+@cbv(router)
+class HealthRouter:
+    @router.get('/db')
+    async def db_pool_status(self):
+        return db.pool_status()
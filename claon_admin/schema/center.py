@@ -1,47 +1,48 @@
-import json
+from dataclasses import dataclass
 from typing import List
-from uuid import uuid4
 
-from sqlalchemy import String, Column, ForeignKey, Boolean, select
+from sqlalchemy import String, Column, ForeignKey, Boolean, select, event, DDL
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.dialects.postgresql import TEXT
 
-from claon_admin.schema.conn import Base
+from claon_admin.common.util.id import generate_id, assign_ids
+from claon_admin.schema.conn import Base, bulk_insert
+from claon_admin.schema.types import JsonDocument, EmbeddedList, json_array_contains
 
 
+@dataclass(frozen=True, slots=True)
 class OperatingTime:
-    def __init__(self, day_of_week: str, start_time: str, end_time: str):
-        self.day_of_week = day_of_week
-        self.start_time = start_time
-        self.end_time = end_time
+    day_of_week: str
+    start_time: str
+    end_time: str
 
 
+@dataclass(frozen=True, slots=True)
 class Utility:
-    def __init__(self, name: str):
-        self.name = name
+    name: str
 
 
+@dataclass(frozen=True, slots=True)
 class CenterImage:
-    def __init__(self, url: str):
-        self.url = url
+    url: str
 
 
+@dataclass(frozen=True, slots=True)
 class CenterFee:
-    def __init__(self, name: str, price: int, count: int):
-        self.name = name
-        self.price = price
-        self.count = count
+    name: str
+    price: int
+    count: int
 
 
+@dataclass(frozen=True, slots=True)
 class CenterFeeImage:
-    def __init__(self, url: str):
-        self.url = url
+    url: str
 
 
 class Center(Base):
     __tablename__ = 'tb_center'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     name = Column(String(length=30), nullable=False)
     profile_img = Column(TEXT, nullable=False)
     address = Column(String(length=255), nullable=False)
@@ -52,11 +53,11 @@ class Center(Base):
     youtube_url = Column(String(length=500))
     approved = Column(Boolean, default=False, nullable=False)
 
-    _center_img = Column(TEXT)
-    _operating_time = Column(TEXT)
-    _utility = Column(TEXT)
-    _fee = Column(TEXT)
-    _fee_img = Column(TEXT)
+    _center_img = Column(JsonDocument)
+    _operating_time = Column(JsonDocument)
+    _utility = Column(JsonDocument)
+    _fee = Column(JsonDocument)
+    _fee_img = Column(JsonDocument)
 
     holds = relationship("CenterHold", back_populates="center")
     walls = relationship("CenterWall", back_populates="center")
@@ -64,55 +65,24 @@ class Center(Base):
     user_id = Column(String(length=255), ForeignKey("tb_user.id"))
     user = relationship("User")
 
-    @property
-    def center_img(self):
-        values = json.loads(self._center_img)
-        return [CenterImage(value['url']) for value in values]
+    center_img = EmbeddedList("_center_img", CenterImage)
+    operating_time = EmbeddedList("_operating_time", OperatingTime)
+    utility = EmbeddedList("_utility", Utility)
+    fee = EmbeddedList("_fee", CenterFee)
+    fee_img = EmbeddedList("_fee_img", CenterFeeImage)
 
-    @center_img.setter
-    def center_img(self, values: List[CenterImage]):
-        self._center_img = json.dumps([value.__dict__ for value in values], default=str)
 
-    @property
-    def operating_time(self):
-        values = json.loads(self._operating_time)
-        return [OperatingTime(value['day_of_week'], value['start_time'], value['end_time']) for value in values]
-
-    @operating_time.setter
-    def operating_time(self, values: List[OperatingTime]):
-        self._operating_time = json.dumps([value.__dict__ for value in values], default=str)
-
-    @property
-    def utility(self):
-        values = json.loads(self._utility)
-        return [Utility(value['name']) for value in values]
-
-    @utility.setter
-    def utility(self, values: List[Utility]):
-        self._utility = json.dumps([value.__dict__ for value in values], default=str)
-
-    @property
-    def fee(self):
-        values = json.loads(self._fee)
-        return [CenterFee(value['name'], value['price'], value['count']) for value in values]
-
-    @fee.setter
-    def fee(self, values: List[CenterFee]):
-        self._fee = json.dumps([value.__dict__ for value in values], default=str)
-
-    @property
-    def fee_img(self):
-        data = json.loads(self._fee_img)
-        return [CenterFeeImage(e['url']) for e in data]
-
-    @fee_img.setter
-    def fee_img(self, values: List[CenterFeeImage]):
-        self._fee_img = json.dumps([value.__dict__ for value in values], default=str)
+event.listen(
+    Center.__table__,
+    "after_create",
+    DDL("CREATE INDEX IF NOT EXISTS ix_tb_center_utility ON tb_center USING gin (_utility jsonb_path_ops)")
+    .execute_if(dialect="postgresql")
+)
 
 
 class CenterHold(Base):
     __tablename__ = 'tb_center_hold'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     name = Column(String(length=10))
     difficulty = Column(String(length=10))
     is_color = Column(Boolean, default=False, nullable=False)
@@ -123,7 +93,7 @@ class CenterHold(Base):
 
 class CenterWall(Base):
     __tablename__ = 'tb_center_wall'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     name = Column(String(length=20))
     type = Column(String(length=20))
 
@@ -133,7 +103,7 @@ class CenterWall(Base):
 
 class CenterApprovedFile(Base):
     __tablename__ = 'tb_center_approved_file'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     url = Column(String(length=255))
 
     user_id = Column(String(length=255), ForeignKey('tb_user.id'), nullable=False)
@@ -150,6 +120,11 @@ class CenterRepository:
                                        .options(selectinload(Center.walls)))
         return result.scalars().one_or_none()
 
+    @staticmethod
+    async def find_all_by_utility(session: AsyncSession, utility: str):
+        result = await session.execute(select(Center).where(json_array_contains(Center._utility, name=utility)))
+        return result.scalars().all()
+
     @staticmethod
     async def save(session: AsyncSession, center: Center):
         session.add(center)
@@ -166,10 +141,15 @@ class CenterApprovedFileRepository:
 
     @staticmethod
     async def save_all(session: AsyncSession, center_approved_files: List[CenterApprovedFile]):
+        assign_ids(center_approved_files)
         session.add_all(center_approved_files)
         await session.flush()
         return center_approved_files
 
+    @staticmethod
+    async def insert_all(session: AsyncSession, center_approved_files: List[CenterApprovedFile]):
+        return await bulk_insert(session, center_approved_files)
+
 
 class CenterHoldRepository:
     @staticmethod
@@ -180,10 +160,15 @@ class CenterHoldRepository:
 
     @staticmethod
     async def save_all(session: AsyncSession, center_holds: List[CenterHold]):
+        assign_ids(center_holds)
         session.add_all(center_holds)
         await session.flush()
         return center_holds
 
+    @staticmethod
+    async def insert_all(session: AsyncSession, center_holds: List[CenterHold]):
+        return await bulk_insert(session, center_holds)
+
 
 class CenterWallRepository:
     @staticmethod
@@ -194,6 +179,11 @@ class CenterWallRepository:
 
     @staticmethod
     async def save_all(session: AsyncSession, center_walls: List[CenterWall]):
+        assign_ids(center_walls)
         session.add_all(center_walls)
         await session.flush()
         return center_walls
+
+    @staticmethod
+    async def insert_all(session: AsyncSession, center_walls: List[CenterWall]):
+        return await bulk_insert(session, center_walls)
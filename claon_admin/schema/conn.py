@@ -1,16 +1,113 @@
+import asyncio
+import time
+from typing import List, TypeVar
+
+from sqlalchemy import inspect, insert
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+from claon_admin.common.util.id import assign_ids
+
 Base = declarative_base()
 
+T = TypeVar("T")
+
+
+def _to_row(mapper, entity) -> dict:
+    row = {}
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        value = getattr(entity, prop.key)
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        row[column.key] = value
+    return row
+
+
+async def bulk_insert(session: AsyncSession, entities: List[T]) -> List[T]:
+    """
+    Insert transient entities of one mapped class with a single executemany INSERT.
+    Entities are not attached to the session, so relationships must be set by foreign key columns.
+    """
+    if not entities:
+        return entities
+
+    assign_ids(entities)
+    mapper = inspect(type(entities[0]))
+    await session.execute(insert(mapper.local_table), [_to_row(mapper, e) for e in entities])
+    return entities
+
+
+class PoolMetrics:
+    """ Accumulates how long requests waited to check out a connection """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def observe(self, wait_ms: float):
+        self.checkouts += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def snapshot(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 3)
+        }
+
 
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self._engine: AsyncEngine = create_async_engine(db_url, echo=True, pool_pre_ping=True)
+    def __init__(self,
+                 db_url: str,
+                 echo: bool = False,
+                 pool_size: int = 5,
+                 max_overflow: int = 10,
+                 pool_recycle: int = 1800,
+                 pool_timeout: int = 30,
+                 statement_cache_size: int = 100) -> None:
+        options = dict(echo=echo, pool_pre_ping=True)
+        if make_url(db_url).get_backend_name() != "sqlite":
+            options.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_recycle=pool_recycle,
+                pool_timeout=pool_timeout,
+                connect_args={"prepared_statement_cache_size": statement_cache_size}
+            )
+
+        self._engine: AsyncEngine = create_async_engine(db_url, **options)
+        self._warm_size = pool_size if "pool_size" in options else 1
+        self._capacity = pool_size + max_overflow if "pool_size" in options else 0
+        self.metrics = PoolMetrics()
         self.async_session_maker = sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
 
+    async def connect(self) -> None:
+        """ Open the pool's base connections up front so the first requests do not pay for the handshakes """
+        connections = await asyncio.gather(*(self._engine.connect() for _ in range(self._warm_size)))
+        for connection in connections:
+            await connection.close()
+
+    async def disconnect(self) -> None:
+        await self._engine.dispose()
+
+    def pool_status(self) -> dict:
+        pool = self._engine.pool
+        status = {"pool": pool.status(), **self.metrics.snapshot()}
+        if self._capacity:
+            status.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                saturation=round(pool.checkedout() / self._capacity, 3)
+            )
+        return status
+
     async def create_database(self) -> None:
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
@@ -27,10 +124,15 @@ class Database:
     async def get_db(self) -> AsyncSession:
         async with self.async_session_maker() as session:
             try:
+                start = time.perf_counter()
+                await session.connection()
+                self.metrics.observe((time.perf_counter() - start) * 1000)
+
                 yield session
                 await session.commit()
             except Exception:
                 await session.rollback()
+                raise
             finally:
                 await session.close()
 
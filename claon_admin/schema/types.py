@@ -0,0 +1,105 @@
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import Boolean, JSON, and_, exists, func, literal, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class JsonDocument(TypeDecorator):
+    """ Stores a JSON document as JSONB on PostgreSQL and as JSON on other dialects """
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
+
+def to_document(values: Iterable[Any]) -> List[Dict[str, Any]]:
+    """ Convert dataclass value objects into JSON-compatible dicts, stringifying values such as dates """
+    document = []
+    for e in values:
+        item = {}
+        for field in fields(e):
+            value = getattr(e, field.name)
+            item[field.name] = value if isinstance(value, JSON_SCALAR_TYPES) else str(value)
+        document.append(item)
+    return document
+
+
+class EmbeddedList:
+    """
+    Exposes a JSON array column as a tuple of value objects.
+    The decoded tuple is cached on the instance and reused while the column still holds the same loaded value,
+    so it is rebuilt only after the setter runs or the row is refreshed.
+    """
+
+    def __init__(self, column: str, value_type: Type):
+        self.column = column
+        self.value_type = value_type
+        self.cache_key: Optional[str] = None
+
+    def __set_name__(self, owner, name):
+        self.cache_key = "_%s_decoded" % name
+
+    def __get__(self, instance, owner) -> Tuple[Any, ...]:
+        if instance is None:
+            return self
+
+        document = getattr(instance, self.column)
+        cached = instance.__dict__.get(self.cache_key)
+        if cached is not None and cached[0] is document:
+            return cached[1]
+
+        return self._decode(instance, document)
+
+    def __set__(self, instance, values: Iterable[Any]):
+        document = to_document(values)
+        setattr(instance, self.column, document)
+        self._decode(instance, document)
+
+    def _decode(self, instance, document: Optional[List[Dict[str, Any]]]) -> Tuple[Any, ...]:
+        decoded = tuple(self.value_type(**value) for value in document or ())
+        instance.__dict__[self.cache_key] = (document, decoded)
+        return decoded
+
+
+class json_array_contains(FunctionElement):
+    """
+    True if the JSON array in the column has an object element with all of the given fields.
+    The fields are rendered at compile time, so statements using it are excluded from the compiled cache.
+    """
+    type = Boolean()
+    name = "json_array_contains"
+    inherit_cache = False
+
+    def __init__(self, column, **fields):
+        self.fields = fields
+        super().__init__(column)
+
+
+@compiles(json_array_contains, "postgresql")
+def _compile_json_array_contains_postgresql(element, compiler, **kw):
+    column = list(element.clauses)[0]
+    return compiler.process(type_coerce(column, JSONB).contains([element.fields]), **kw)
+
+
+@compiles(json_array_contains)
+def _compile_json_array_contains(element, compiler, **kw):
+    column = list(element.clauses)[0]
+    elements = func.json_each(column).table_valued("value")
+    return compiler.process(
+        exists(
+            select(literal(1)).select_from(elements).where(and_(*[
+                func.json_extract(elements.c.value, "$." + key) == value
+                for key, value in element.fields.items()
+            ]))
+        ),
+        **kw
+    )
@@ -1,7 +1,6 @@
-import json
+from dataclasses import dataclass
 from datetime import date
 from typing import List
-from uuid import uuid4
 
 from sqlalchemy import Column, String, Enum, Boolean, ForeignKey, select, exists, and_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,33 +8,35 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import TEXT
 
 from claon_admin.model.enum import Role
-from claon_admin.schema.conn import Base
+from claon_admin.common.util.id import generate_id, assign_ids
+from claon_admin.schema.conn import Base, bulk_insert
+from claon_admin.schema.types import JsonDocument, EmbeddedList
 
 
+@dataclass(frozen=True, slots=True)
 class Contest:
-    def __init__(self, year: int, title: str, name: str):
-        self.year = year
-        self.title = title
-        self.name = name
+    year: int
+    title: str
+    name: str
 
 
+@dataclass(frozen=True, slots=True)
 class Certificate:
-    def __init__(self, acquisition_date: date, rate: int, name: str):
-        self.acquisition_date = acquisition_date
-        self.rate = rate
-        self.name = name
+    acquisition_date: date
+    rate: int
+    name: str
 
 
+@dataclass(frozen=True, slots=True)
 class Career:
-    def __init__(self, start_date: date, end_date: date, name: str):
-        self.start_date = start_date
-        self.end_date = end_date
-        self.name = name
+    start_date: date
+    end_date: date
+    name: str
 
 
 class User(Base):
     __tablename__ = 'tb_user'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     oauth_id = Column(String(length=255), nullable=False)
     nickname = Column(String(length=40), nullable=False, unique=True)
     profile_img = Column(TEXT, nullable=False)
@@ -53,48 +54,25 @@ class User(Base):
 
 class Lector(Base):
     __tablename__ = 'tb_lector'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     is_setter = Column(Boolean, default=False, nullable=False)
     approved = Column(Boolean, default=False, nullable=False)
 
-    _contest = Column(TEXT)
-    _certificate = Column(TEXT)
-    _career = Column(TEXT)
+    _contest = Column(JsonDocument)
+    _certificate = Column(JsonDocument)
+    _career = Column(JsonDocument)
 
     user_id = Column(String(length=255), ForeignKey("tb_user.id"), unique=True, nullable=False)
     user = relationship("User")
 
-    @property
-    def contest(self):
-        values = json.loads(self._contest)
-        return [Contest(value['year'], value['title'], value['name']) for value in values]
-
-    @contest.setter
-    def contest(self, values: List[Contest]):
-        self._contest = json.dumps([value.__dict__ for value in values], default=str)
-
-    @property
-    def certificate(self):
-        values = json.loads(self._certificate)
-        return [Certificate(value['acquisition_date'], value['rate'], value['name']) for value in values]
-
-    @certificate.setter
-    def certificate(self, values: List[Certificate]):
-        self._certificate = json.dumps([value.__dict__ for value in values], default=str)
-
-    @property
-    def career(self):
-        values = json.loads(self._career)
-        return [Career(value['start_date'], value['end_date'], value['name']) for value in values]
-
-    @career.setter
-    def career(self, values: List[Career]):
-        self._career = json.dumps([value.__dict__ for value in values], default=str)
+    contest = EmbeddedList("_contest", Contest)
+    certificate = EmbeddedList("_certificate", Certificate)
+    career = EmbeddedList("_career", Career)
 
 
 class LectorApprovedFile(Base):
     __tablename__ = 'tb_lector_approved_file'
-    id = Column(String(length=255), primary_key=True, default=str(uuid4()))
+    id = Column(String(length=255), primary_key=True, default=generate_id)
     url = Column(String(length=255))
 
     lector_id = Column(String(length=255), ForeignKey('tb_lector.id'))
@@ -151,6 +129,11 @@ class LectorApprovedFileRepository:
 
     @staticmethod
     async def save_all(session: AsyncSession, approved_files: List[LectorApprovedFile]):
+        assign_ids(approved_files)
         session.add_all(approved_files)
         await session.flush()
         return approved_files
+
+    @staticmethod
+    async def insert_all(session: AsyncSession, approved_files: List[LectorApprovedFile]):
+        return await bulk_insert(session, approved_files)
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from claon_admin.common.error.exception import BadRequestException, ErrorCode, NotFoundException
+from claon_admin.common.util.s3 import make_key_name, create_presigned_post, head_object, read_object_prefix, \
+    delete_object, object_url
+from claon_admin.model.center import PresignedUploadRequestDto, PresignedUploadResponseDto, ConfirmUploadRequestDto, \
+    UploadFileResponseDto
+from claon_admin.model.enum import CenterUploadPurpose
+
+PRESIGNED_URL_EXPIRES_IN = 300
+
+IMAGE_CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp")
+
+FILE_SIGNATURES: Dict[str, Tuple[bytes, ...]] = {
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/webp": (b"RIFF",),
+    "application/pdf": (b"%PDF-",)
+}
+
+
+@dataclass(frozen=True)
+class UploadPolicy:
+    content_types: Tuple[str, ...]
+    max_size: int
+
+
+UPLOAD_POLICIES: Dict[CenterUploadPurpose, UploadPolicy] = {
+    CenterUploadPurpose.PROFILE: UploadPolicy(IMAGE_CONTENT_TYPES, 10 * 1024 * 1024),
+    CenterUploadPurpose.IMAGE: UploadPolicy(IMAGE_CONTENT_TYPES, 10 * 1024 * 1024),
+    CenterUploadPurpose.FEE: UploadPolicy(IMAGE_CONTENT_TYPES, 10 * 1024 * 1024),
+    CenterUploadPurpose.PROOF: UploadPolicy(IMAGE_CONTENT_TYPES + ("application/pdf",), 20 * 1024 * 1024)
+}
+
+
+def is_valid_signature(content_type: str, prefix: bytes) -> bool:
+    if content_type == "image/webp":
+        return prefix[:4] == b"RIFF" and prefix[8:12] == b"WEBP"
+    return prefix.startswith(FILE_SIGNATURES.get(content_type, ()))
+
+
+class CenterService:
+    async def create_presigned_upload(self, purpose: CenterUploadPurpose, dto: PresignedUploadRequestDto):
+        policy = UPLOAD_POLICIES[purpose]
+
+        if dto.content_type not in policy.content_types:
+            raise BadRequestException(
+                ErrorCode.INVALID_UPLOAD_FILE,
+                "지원하지 않는 파일 형식입니다."
+            )
+
+        if dto.size > policy.max_size:
+            raise BadRequestException(
+                ErrorCode.INVALID_UPLOAD_FILE,
+                "파일 크기는 %dMB 이하로 업로드 해주세요." % (policy.max_size // (1024 * 1024))
+            )
+
+        key_name = make_key_name("center", purpose.value, dto.filename)
+        presigned_post = create_presigned_post(key_name, dto.content_type, policy.max_size, PRESIGNED_URL_EXPIRES_IN)
+
+        return PresignedUploadResponseDto(
+            url=presigned_post["url"],
+            fields=presigned_post["fields"],
+            key=key_name,
+            expires_in=PRESIGNED_URL_EXPIRES_IN
+        )
+
+    async def confirm_upload(self, purpose: CenterUploadPurpose, dto: ConfirmUploadRequestDto):
+        policy = UPLOAD_POLICIES[purpose]
+
+        if not dto.key.startswith("center/%s/" % purpose.value):
+            raise BadRequestException(
+                ErrorCode.INVALID_UPLOAD_FILE,
+                "업로드 목적과 일치하지 않는 파일입니다."
+            )
+
+        metadata = await head_object(dto.key)
+        if metadata is None:
+            raise NotFoundException(
+                ErrorCode.DATA_DOES_NOT_EXIST,
+                "업로드된 파일이 존재하지 않습니다."
+            )
+
+        content_type = metadata.get("ContentType")
+        if metadata["ContentLength"] > policy.max_size or content_type not in policy.content_types \
+                or not is_valid_signature(content_type, await read_object_prefix(dto.key, 12)):
+            await delete_object(dto.key)
+            raise BadRequestException(
+                ErrorCode.INVALID_UPLOAD_FILE,
+                "업로드된 파일의 형식 또는 크기가 올바르지 않습니다."
+            )
+
+        return UploadFileResponseDto(file_url=object_url(dto.key))
@@ -3,6 +3,7 @@ import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.common.util.cache import subject_cache
 from claon_admin.model.auth import RequestUser
 from claon_admin.model.center import CenterRequestDto, CenterResponseDto
 from claon_admin.model.user import IsDuplicatedNicknameResponseDto, LectorRequestDto, LectorResponseDto, \
@@ -76,24 +77,26 @@ class UserService:
             approved=False
         ))
 
-        holds = await self.center_hold_repository.save_all(
+        holds = await self.center_hold_repository.insert_all(
             session,
-            [CenterHold(center=center, name=e.name, difficulty=e.difficulty, is_color=e.is_color)
+            [CenterHold(center_id=center.id, name=e.name, difficulty=e.difficulty, is_color=e.is_color)
              for e in dto.hold_list]
         )
 
-        walls = await self.center_wall_repository.save_all(
+        walls = await self.center_wall_repository.insert_all(
             session,
-            [CenterWall(center=center, name=e.name, type=e.wall_type.value)
+            [CenterWall(center_id=center.id, name=e.name, type=e.wall_type.value)
              for e in dto.wall_list]
         )
 
-        await self.center_approved_file_repository.save_all(
+        await self.center_approved_file_repository.insert_all(
             session,
-            [CenterApprovedFile(user_id=subject.id, center=center, url=e)
+            [CenterApprovedFile(user_id=subject.id, center_id=center.id, url=e)
              for e in dto.proof_list]
         )
 
+        subject_cache.invalidate(subject.id)
+
         return CenterResponseDto.from_entity(center, holds, walls)
 
     async def sign_up_lector(self, session: AsyncSession, subject: RequestUser, dto: LectorRequestDto):
@@ -124,12 +127,14 @@ class UserService:
             approved=False
         ))
 
-        await self.lector_approved_file_repository.save_all(
+        await self.lector_approved_file_repository.insert_all(
             session,
-            [LectorApprovedFile(lector=lector, url=e)
+            [LectorApprovedFile(lector_id=lector.id, url=e)
              for e in dto.proof_list]
         )
 
+        subject_cache.invalidate(subject.id)
+
         return LectorResponseDto.from_entity(lector)
 
     async def sign_in(self,
@@ -154,7 +159,7 @@ class UserService:
 
         return JwtResponseDto(
             access_token=create_access_token(user.id),
-            refresh_token=create_refresh_token(user.id),
+            refresh_token=await create_refresh_token(user.id),
             is_signed_up=is_signed_up,
             profile=UserProfileResponseDto(
                 profile_image=user.profile_img,
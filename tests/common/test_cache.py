@@ -0,0 +1,73 @@
+import time
+
+from claon_admin.common.util.cache import TTLCache, SubjectCache
+from claon_admin.model.auth import RequestUser
+from claon_admin.model.enum import Role
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    # given
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # when
+    cache.set("c", 3)
+
+    # then
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entry():
+    # given
+    cache = TTLCache(max_size=2)
+
+    # when
+    cache.set("a", 1, ttl=-1)
+
+    # then
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_subject_cache_hit_requires_same_refresh_token():
+    # given
+    cache = SubjectCache(max_size=10)
+    subject = RequestUser(id="user_id", email="test@claon.com", role=Role.PENDING)
+
+    # when
+    cache.set("access", "refresh", subject, time.time() + 60)
+
+    # then
+    assert cache.get("access", "refresh") == subject
+    assert cache.get("access", "other_refresh") is None
+
+
+def test_subject_cache_skips_expired_token():
+    # given
+    cache = SubjectCache(max_size=10)
+    subject = RequestUser(id="user_id", email="test@claon.com", role=Role.PENDING)
+
+    # when
+    cache.set("access", "refresh", subject, time.time() - 1)
+
+    # then
+    assert cache.get("access", "refresh") is None
+
+
+def test_subject_cache_invalidate_user():
+    # given
+    cache = SubjectCache(max_size=10)
+    subject = RequestUser(id="user_id", email="test@claon.com", role=Role.PENDING)
+    cache.set("access", "refresh", subject, time.time() + 60)
+    cache.set("other_access", "refresh", subject, time.time() + 60)
+
+    # when
+    cache.invalidate(subject.id)
+
+    # then
+    assert cache.get("access", "refresh") is None
+    assert cache.get("other_access", "refresh") is None
@@ -0,0 +1,37 @@
+import uuid
+
+from claon_admin.common.util.id import generate_id, generate_ids, assign_ids
+
+
+def test_generate_id_is_uuid7():
+    # when
+    value = uuid.UUID(generate_id())
+
+    # then
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_generate_ids_are_unique_and_time_ordered():
+    # when
+    ids = generate_ids(5000) + generate_ids(10)
+
+    # then
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_assign_ids_keeps_existing_id():
+    # given
+    class Entity:
+        def __init__(self, id=None):
+            self.id = id
+
+    entities = [Entity("existing"), Entity(), Entity()]
+
+    # when
+    assign_ids(entities)
+
+    # then
+    assert entities[0].id == "existing"
+    assert entities[1].id < entities[2].id
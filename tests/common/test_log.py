@@ -0,0 +1,41 @@
+import json
+import logging
+import queue
+
+from claon_admin.common.util.log import JsonFormatter, BoundedQueueHandler
+
+
+def test_json_formatter_includes_extra_fields():
+    # given
+    record = logging.makeLogRecord({
+        "name": "test",
+        "levelname": "INFO",
+        "msg": "status_code: %s",
+        "args": (200,),
+        "request_id": "request_id",
+        "latency_ms": 1.5
+    })
+
+    # when
+    result = json.loads(JsonFormatter().format(record))
+
+    # then
+    assert result["message"] == "status_code: 200"
+    assert result["level"] == "INFO"
+    assert result["request_id"] == "request_id"
+    assert result["latency_ms"] == 1.5
+    assert "args" not in result
+
+
+def test_bounded_queue_handler_drops_when_full():
+    # given
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+    record = logging.makeLogRecord({"msg": "message"})
+
+    # when
+    handler.handle(record)
+    handler.handle(record)
+
+    # then
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
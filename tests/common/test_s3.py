@@ -0,0 +1,35 @@
+import io
+
+from fastapi import UploadFile
+
+from claon_admin.common.util.s3 import upload_stream, PART_SIZE
+from claon_admin.config.consts import BUCKET
+
+
+async def test_upload_small_file(s3_client):
+    # given
+    file = UploadFile(file=io.BytesIO(b"small file"), filename="image.png")
+
+    # when
+    await upload_stream(file, "center/image/small.png", "image/png", s3_client)
+
+    # then
+    result = s3_client.get_object(Bucket=BUCKET, Key="center/image/small.png")
+    assert result["Body"].read() == b"small file"
+    assert result["ContentType"] == "image/png"
+
+
+async def test_upload_large_file_in_parts(s3_client):
+    # given
+    data = b"".join(bytes([i]) * PART_SIZE for i in range(2)) + b"tail"
+    file = UploadFile(file=io.BytesIO(data), filename="proof.pdf")
+
+    # when
+    await upload_stream(file, "center/proof/large.pdf", "application/pdf", s3_client)
+
+    # then
+    result = s3_client.get_object(Bucket=BUCKET, Key="center/proof/large.pdf")
+    assert result["Body"].read() == data
+    assert result["ContentType"] == "application/pdf"
+    assert result["ETag"].strip('"').endswith("-3")
+    assert s3_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
@@ -1,6 +1,8 @@
 import asyncio
+import boto3
 import nest_asyncio
 import pytest
+from moto import mock_aws
 
 pytest_plugins = [
     "tests.repository.fixtures"
@@ -32,3 +34,14 @@ async def session(db):
     finally:
         await session.rollback()
         await session.close()
+
+
+@pytest.fixture
+def s3_client(mocker):
+    from claon_admin.config.consts import BUCKET
+
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        mocker.patch("claon_admin.common.util.s3.get_s3_client", return_value=client)
+        yield client
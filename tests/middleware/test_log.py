@@ -0,0 +1,58 @@
+import logging
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from claon_admin.middleware.log import LoggerMiddleware
+
+
+async def echo(request):
+    return JSONResponse(await request.json())
+
+
+async def stream(request):
+    async def chunks():
+        for i in range(3):
+            yield f"chunk{i}".encode()
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+app = Starlette(routes=[Route("/echo", echo, methods=["POST"]), Route("/stream", stream), Route("/skip", stream)])
+app.add_middleware(LoggerMiddleware, body_limit=8, sample_rates={"/skip": 0})
+client = TestClient(app)
+
+
+def test_log_request_and_response_body(caplog):
+    # when
+    with caplog.at_level(logging.INFO):
+        response = client.post("/echo", json={"key": "value"})
+
+    # then
+    assert response.json() == {"key": "value"}
+    assert "[REQUEST] [POST] path: /echo" in caplog.text
+    assert '[REQUEST] body (16 bytes): {"key": ...' in caplog.text
+    assert '[RESPONSE] body (15 bytes): {"key":"...' in caplog.text
+    assert "[RESPONSE] status_code: 200" in caplog.text
+
+
+def test_log_streaming_response_without_buffering(caplog):
+    # when
+    with caplog.at_level(logging.INFO):
+        response = client.get("/stream")
+
+    # then
+    assert response.text == "chunk0chunk1chunk2"
+    assert "[RESPONSE] body (18 bytes): chunk0ch..." in caplog.text
+
+
+def test_skip_unsampled_route(caplog):
+    # when
+    with caplog.at_level(logging.INFO):
+        response = client.get("/skip")
+
+    # then
+    assert response.status_code == 200
+    assert "path: /skip" not in caplog.text
@@ -1,10 +1,11 @@
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.model.enum import WallType
 from claon_admin.schema.center import (
     CenterRepository,
-    CenterApprovedFileRepository, CenterHoldRepository, CenterWallRepository, Center, CenterHold, CenterWall
+    CenterApprovedFileRepository, CenterHoldRepository, CenterWallRepository, Center, CenterHold, CenterWall, Utility
 )
 from claon_admin.schema.user import User
 
@@ -97,6 +98,46 @@ async def test_save_all_center_holds(
     assert center_holds == [center_holds_fixture]
 
 
+@pytest.mark.asyncio
+async def test_save_all_new_center_holds_assigns_distinct_ids(
+        session: AsyncSession,
+        center_fixture: Center
+):
+    # given
+    center_holds = [
+        CenterHold(center=center_fixture, name="hold%d" % i, difficulty="hard", is_color=False) for i in range(3)
+    ]
+
+    # when
+    center_holds = await center_hold_repository.save_all(session, center_holds)
+
+    # then
+    assert len({h.id for h in center_holds}) == 3
+    assert [h.id for h in center_holds] == sorted(h.id for h in center_holds)
+
+
+@pytest.mark.asyncio
+async def test_insert_all_center_holds(
+        session: AsyncSession,
+        center_fixture: Center
+):
+    # given
+    center_holds = [
+        CenterHold(center_id=center_fixture.id, name="bulk%d" % i, difficulty="easy") for i in range(20)
+    ]
+
+    # when
+    center_holds = await center_hold_repository.insert_all(session, center_holds)
+
+    # then
+    result = await session.execute(
+        select(CenterHold.id, CenterHold.is_color).where(CenterHold.name.like("bulk%"))
+    )
+    rows = result.all()
+    assert sorted(r.id for r in rows) == sorted(h.id for h in center_holds)
+    assert all(r.is_color is False for r in rows)
+
+
 @pytest.mark.asyncio
 async def test_save_center_wall(
         session: AsyncSession,
@@ -119,3 +160,56 @@ async def test_save_all_center_walls(
 
     # then
     assert center_walls == [center_walls_fixture]
+
+
+@pytest.mark.asyncio
+async def test_find_all_centers_by_utility(
+        session: AsyncSession,
+        center_fixture: Center
+):
+    # when
+    result = await center_repository.find_all_by_utility(session, "test_utility")
+
+    # then
+    assert result == [center_fixture]
+
+
+@pytest.mark.asyncio
+async def test_find_all_centers_by_not_existing_utility(
+        session: AsyncSession,
+        center_fixture: Center
+):
+    # when
+    result = await center_repository.find_all_by_utility(session, "not_existing_utility")
+
+    # then
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_center_embedded_collections_are_decoded_once(
+        session: AsyncSession,
+        center_fixture: Center
+):
+    # when
+    first = center_fixture.utility
+    second = center_fixture.utility
+
+    # then
+    assert first is second
+    assert first == (Utility(name="test_utility"),)
+
+
+@pytest.mark.asyncio
+async def test_center_embedded_collection_is_decoded_again_after_set(session: AsyncSession):
+    # given
+    center = Center(utility=[Utility(name="before")])
+    before = center.utility
+
+    # when
+    center.utility = [Utility(name="after")]
+
+    # then
+    assert before == (Utility(name="before"),)
+    assert center.utility == (Utility(name="after"),)
+    assert center._utility == [{"name": "after"}]
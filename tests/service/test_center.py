@@ -0,0 +1,89 @@
+import pytest
+
+from claon_admin.common.error.exception import BadRequestException, NotFoundException
+from claon_admin.config.consts import BUCKET
+from claon_admin.model.center import PresignedUploadRequestDto, ConfirmUploadRequestDto
+from claon_admin.model.enum import CenterUploadPurpose
+from claon_admin.service.center import CenterService
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture
+def center_service():
+    return CenterService()
+
+
+@pytest.mark.asyncio
+async def test_create_presigned_upload(s3_client, center_service: CenterService):
+    # given
+    dto = PresignedUploadRequestDto(filename="profile.png", content_type="image/png", size=1024)
+
+    # when
+    result = await center_service.create_presigned_upload(CenterUploadPurpose.PROFILE, dto)
+
+    # then
+    assert result.key.startswith("center/profile/")
+    assert result.key.endswith(".png")
+    assert result.fields["key"] == result.key
+    assert result.fields["Content-Type"] == "image/png"
+    assert "policy" in result.fields
+
+
+@pytest.mark.asyncio
+async def test_create_presigned_upload_with_invalid_content_type(s3_client, center_service: CenterService):
+    # given
+    dto = PresignedUploadRequestDto(filename="proof.pdf", content_type="application/pdf", size=1024)
+
+    # then
+    with pytest.raises(BadRequestException):
+        # when
+        await center_service.create_presigned_upload(CenterUploadPurpose.IMAGE, dto)
+
+
+@pytest.mark.asyncio
+async def test_create_presigned_upload_with_too_large_file(s3_client, center_service: CenterService):
+    # given
+    dto = PresignedUploadRequestDto(filename="proof.pdf", content_type="application/pdf", size=100 * 1024 * 1024)
+
+    # then
+    with pytest.raises(BadRequestException):
+        # when
+        await center_service.create_presigned_upload(CenterUploadPurpose.PROOF, dto)
+
+
+@pytest.mark.asyncio
+async def test_confirm_upload(s3_client, center_service: CenterService):
+    # given
+    key = "center/image/2023-04-21/image.png"
+    s3_client.put_object(Bucket=BUCKET, Key=key, Body=PNG_HEADER + b"data", ContentType="image/png")
+
+    # when
+    result = await center_service.confirm_upload(CenterUploadPurpose.IMAGE, ConfirmUploadRequestDto(key=key))
+
+    # then
+    assert result.file_url.endswith(key)
+
+
+@pytest.mark.asyncio
+async def test_confirm_upload_with_mismatched_signature(s3_client, center_service: CenterService):
+    # given
+    key = "center/image/2023-04-21/image.png"
+    s3_client.put_object(Bucket=BUCKET, Key=key, Body=b"<html></html>", ContentType="image/png")
+
+    # then
+    with pytest.raises(BadRequestException):
+        # when
+        await center_service.confirm_upload(CenterUploadPurpose.IMAGE, ConfirmUploadRequestDto(key=key))
+    assert s3_client.list_objects_v2(Bucket=BUCKET).get("KeyCount") == 0
+
+
+@pytest.mark.asyncio
+async def test_confirm_not_uploaded_file(s3_client, center_service: CenterService):
+    # given
+    dto = ConfirmUploadRequestDto(key="center/image/2023-04-21/not_existing.png")
+
+    # then
+    with pytest.raises(NotFoundException):
+        # when
+        await center_service.confirm_upload(CenterUploadPurpose.IMAGE, dto)
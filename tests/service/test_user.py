@@ -247,9 +247,9 @@ async def test_sign_up_center(
     request_user = RequestUser(id="123456", email="test@claon.com", role=Role.PENDING)
     mock_repo["user"].exist_by_nickname.side_effect = [False]
     mock_repo["center"].save.side_effect = [mock_center]
-    mock_repo["center_hold"].save_all.side_effect = [mock_center_holds]
-    mock_repo["center_wall"].save_all.side_effect = [mock_center_walls]
-    mock_repo["center_approved_file"].save_all.side_effect = [mock_center_approved_files]
+    mock_repo["center_hold"].insert_all.side_effect = [mock_center_holds]
+    mock_repo["center_wall"].insert_all.side_effect = [mock_center_walls]
+    mock_repo["center_approved_file"].insert_all.side_effect = [mock_center_approved_files]
 
     # when
     result = await user_service.sign_up_center(session, request_user, center_request_dto)
@@ -302,7 +302,7 @@ async def test_sign_up_lector(
     profile = UserProfileResponseDto.from_entity(mock_user)
     mock_repo["user"].exist_by_nickname.side_effect = [False]
     mock_repo["lector"].save.side_effect = [mock_lector]
-    mock_repo["lector_approved_file"].save_all.side_effect = [mock_lector_approved_files]
+    mock_repo["lector_approved_file"].insert_all.side_effect = [mock_lector_approved_files]
 
     request_user = RequestUser(id="123456", email="test@claon.com", role=Role.PENDING)
 